@@ -78,7 +78,8 @@ class AlibabaCollector(BaseCollector):
 # src/collectors/alibaba.py
 import asyncio
 import re
-from typing import List, Dict, Any
+import sys
+from typing import List
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -86,6 +87,8 @@ from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 from bs4 import BeautifulSoup
 
 from src.collectors.base import BaseCollector
+from src.parsers.models import parse_price
+from src.parsers.records import ProductRecord
 from src.utils.throttle import polite_sleep
 
 
@@ -110,8 +113,9 @@ class AlibabaCollector(BaseCollector):
         m = re.search(r'((?:₹|Rs\.?|INR|\$|US\$\s?)\s?[\d,]+(?:\.\d+)?(?:\s*-\s*[\d,]+(?:\.\d+)?)?)', text, re.I)
         return m.group(1).strip() if m else None
 
-    def collect(self, category: str, category_url: str, limit=100, save_raw=False) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
+    def collect(self, category: str, category_url: str, limit=100, save_raw=False) -> List[ProductRecord]:
+        out: List[ProductRecord] = []
+        category = sys.intern(category)
         page = 1
         seen = set()
 
@@ -168,7 +172,8 @@ class AlibabaCollector(BaseCollector):
                     if parent and parent.parent:
                         parent = parent.parent
                 snippet_text = parent.get_text(" ", strip=True) if parent else a.get_text(" ", strip=True)
-                snippet_html = str(parent)[:1200] if parent else ""
+                # raw markup is only kept alongside raw HTML: at ~1.2 KB it dominates per-item memory
+                snippet_html = (str(parent)[:1200] if parent else "") if save_raw else None
 
                 if not title or not href:
                     continue
@@ -178,21 +183,23 @@ class AlibabaCollector(BaseCollector):
                     continue
                 seen.add(key)
 
-                price = self._extract_price(snippet_text)
+                price_min, price_max, currency = parse_price(self._extract_price(snippet_text))
 
                 # supplier heuristics
                 supplier_node = parent.select_one("[class*='supplier'], [class*='company'], .organic-gallery-title__seller, .company-name") if parent else None
                 supplier = supplier_node.get_text(" ", strip=True) if supplier_node else None
 
-                item = {
-                    "marketplace": "alibaba",
-                    "category": category,
-                    "title": title,
-                    "price": price,
-                    "supplier_name": supplier,
-                    "url": href,
-                    "source_html_snippet": snippet_html
-                }
+                item = ProductRecord(
+                    marketplace="alibaba",
+                    category=category,
+                    title=title,
+                    price_min=price_min,
+                    price_max=price_max,
+                    currency=currency,
+                    supplier_name=supplier,
+                    url=href,
+                    source_html_snippet=snippet_html,
+                )
                 out.append(item)
 
             page += 1
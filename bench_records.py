@@ -0,0 +1,99 @@
+#benchmarks\bench_records.py
+# Peak memory / time of the in-flight stage (collect -> validate -> DataFrame):
+#   dicts -> Product -> model_dump() -> DataFrame   vs   ProductRecord -> RecordBatch -> DataFrame,
+#   the latter with the HTML snippet (save_raw_html: true) and without it (the default)
+# usage: python -m benchmarks.bench_records --n 1000000
+import argparse
+import gc
+import time
+import tracemalloc
+
+import pandas as pd
+
+from src.parsers.models import Product
+from src.parsers.records import ProductRecord, RecordBatch
+
+CATEGORIES = ["Industrial Machinery", "Building Construction Material & Equipment", "Electronics", "Textiles"]
+SNIPPET_LEN = 1200
+
+
+def _snippet(i: int) -> str:
+    # a distinct full-size snippet per item, as str(parent)[:1200] yields in the collectors
+    return (f"<div class='card' data-id='{i}'>" + "x" * SNIPPET_LEN)[:SNIPPET_LEN]
+
+
+def _category(i: int) -> str:
+    # new string object per page, like a fresh category read from categories.yaml per crawl
+    return (CATEGORIES[i % len(CATEGORIES)] + " ")[:-1]
+
+
+def baseline(n: int):
+    raw = []
+    for i in range(n):
+        raw.append({
+            "marketplace": "indiamart" if i & 1 else "alibaba",
+            "category": _category(i // 50),
+            "title": f"Product {i}",
+            "price": None,
+            "supplier_name": f"Supplier {i % 5000}",
+            "url": f"https://example.com/p/{i}",
+            "source_html_snippet": _snippet(i),
+        })
+    products = [Product(**r) for r in raw]
+    del raw
+    return pd.DataFrame([p.model_dump() for p in products])
+
+
+def compact(n: int, save_raw: bool = False):
+    raw = []
+    for i in range(n):
+        raw.append(ProductRecord(
+            marketplace="indiamart" if i & 1 else "alibaba",
+            category=_category(i // 50),
+            title=f"Product {i}",
+            supplier_name=f"Supplier {i % 5000}",
+            url=f"https://example.com/p/{i}",
+            source_html_snippet=_snippet(i) if save_raw else None,
+        ))
+    batch = RecordBatch()
+    for r in raw:
+        batch.add(r)
+    del raw
+    return batch.to_pandas()
+
+
+def measure(fn, n: int):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    df = fn(n)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(df) == n
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1_000_000, help="Number of items")
+    args = parser.parse_args()
+
+    results = {}
+    runs = (
+        ("dict+pydantic", baseline),
+        ("record+batch (with snippet)", lambda n: compact(n, save_raw=True)),
+        ("record+batch", compact),
+    )
+    for name, fn in runs:
+        elapsed, peak = measure(fn, args.n)
+        results[name] = peak
+        print(f"[BENCH] {name:27s} n={args.n}  time={elapsed:7.2f}s  peak={peak / 2**20:8.1f} MiB  "
+              f"({peak / args.n:6.0f} B/item)")
+    for name, _ in runs[1:]:
+        ratio = results["dict+pydantic"] / max(results[name], 1)
+        print(f"[BENCH] peak memory reduction, {name}: {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#benchmarks\bench_search.py
+# Build a ProductIndex over a synthetic catalog and report query latency percentiles.
+# usage: python -m benchmarks.bench_search --n 2000000 [--index /tmp/bench_products.db]
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.parsers.records import ProductRecord, RecordBatch
+from src.utils.search_index import ProductIndex
+
+ADJ = ["heavy duty", "stainless", "portable", "industrial", "automatic", "galvanized", "digital", "hydraulic",
+       "decorative", "waterproof", "mini", "commercial", "electric", "manual", "premium", "compact"]
+MATERIAL = ["steel", "pvc", "aluminium", "copper", "cotton", "ceramic", "glass", "wooden", "rubber", "plastic",
+            "cement", "granite", "brass", "nylon", "polyester", "iron"]
+NOUN = ["pipe", "panel", "valve", "pump", "cable", "sheet", "motor", "tile", "fabric", "switch", "bearing",
+        "generator", "transformer", "door", "window", "roofing", "gear", "filter", "compressor", "drill"]
+SYL = ["shri", "ram", "tech", "indo", "global", "star", "ganesh", "balaji", "metal", "fab", "tex", "power",
+       "engineering", "trade", "exim", "sai", "om", "royal", "sun", "crown"]
+CATEGORIES = ["Industrial Machinery", "Building Construction Material & Equipment",
+              "Electronics & Electrical Goods & Supplies", "Textiles, Yarn & Fabrics", "Pipes, Tubes & Fittings",
+              "Hand & Machine Tools", "Pumps & Pumping Equipment", "Kitchen Utensils & Appliances"]
+QUERIES = [
+    ("steel pipe", {}),
+    ("hydraulic pump", {}),
+    ("galvanized steel roofing", {}),
+    ("transf*", {}),
+    ("pu*", {}),
+    ("balaji", {}),
+    ("shri ganesh pvt", {}),
+    ("copper cable", {"marketplace": "indiamart"}),
+    ("motor", {"marketplace": "alibaba", "min_price": 500, "max_price": 5000}),
+    ("pvc", {"max_price": 100}),
+    ("textiles fab*", {"min_price": 1000}),
+    ("nonexistentword", {}),
+]
+
+
+def synthetic_batch(n: int, seed: int = 7) -> RecordBatch:
+    rng = random.Random(seed)
+    batch = RecordBatch()
+    suppliers = [f"{rng.choice(SYL).title()} {rng.choice(SYL).title()} {rng.choice(['Pvt Ltd', 'Enterprises', 'Industries', 'Traders'])}"
+                 for _ in range(50_000)]
+    for i in range(n):
+        title = f"{rng.choice(ADJ)} {rng.choice(MATERIAL)} {rng.choice(NOUN)} {rng.randint(1, 999)}"
+        pmin = round(rng.uniform(10, 20_000), 2) if rng.random() < 0.7 else None
+        batch.add(ProductRecord(
+            marketplace="indiamart" if i & 1 else "alibaba",
+            category=rng.choice(CATEGORIES),
+            title=title,
+            price_min=pmin,
+            price_max=None if pmin is None else round(pmin * rng.uniform(1, 1.5), 2),
+            currency="INR" if i & 1 else "USD",
+            supplier_name=rng.choice(suppliers),
+            url=f"https://example.com/p/{i}",
+        ))
+    return batch
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=2_000_000, help="Catalog size")
+    parser.add_argument("--index", type=str, default=None, help="Index path (default: temp dir)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    path = Path(args.index) if args.index else Path(tempfile.mkdtemp()) / "bench_products.db"
+    with ProductIndex(path) as idx:
+        if len(idx) < args.n:
+            t0 = time.perf_counter()
+            batch = synthetic_batch(args.n)
+            t1 = time.perf_counter()
+            idx.update(batch)
+            idx.optimize()
+            t2 = time.perf_counter()
+            print(f"[BENCH] generated {args.n} products in {t1 - t0:.1f}s, indexed in {t2 - t1:.1f}s "
+                  f"({args.n / (t2 - t1):,.0f} products/s) -> {path}")
+
+            # incremental update: re-crawl of 1% existing + 1% new products
+            k = max(args.n // 100, 1)
+            inc = synthetic_batch(2 * k, seed=11)
+            urls = inc.column("url")
+            for j in range(k, 2 * k):
+                urls[j] = f"https://example.com/new/{j}"
+            t0 = time.perf_counter()
+            idx.update(inc)
+            print(f"[BENCH] incremental update of {2 * k} products in {time.perf_counter() - t0:.2f}s")
+
+        all_ms = []
+        for query, filters in QUERIES:
+            idx.search(query, limit=args.limit, **filters)  # warm cache
+            times = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                hits = idx.search(query, limit=args.limit, **filters)
+                times.append((time.perf_counter() - t0) * 1000)
+            all_ms.extend(times)
+            print(f"[BENCH] {query!r:28s} {str(filters):60s} p50={statistics.median(times):7.2f}ms  "
+                  f"max={max(times):7.2f}ms  hits={len(hits)}")
+        all_ms.sort()
+        p95 = all_ms[int(len(all_ms) * 0.95) - 1]
+        print(f"[BENCH] all queries: p50={statistics.median(all_ms):.2f}ms  p95={p95:.2f}ms  n={len(idx)}")
+
+
+if __name__ == "__main__":
+    main()
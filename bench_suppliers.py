@@ -0,0 +1,116 @@
+#benchmarks\bench_suppliers.py
+# Supplier resolution throughput on products.jsonl, plus cluster quality (pairwise
+# precision/recall) on a synthetic catalog with known supplier identities.
+# usage: python -m benchmarks.bench_suppliers --jsonl data/processed/products.jsonl --suppliers 20000
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from pathlib import Path
+
+from src.parsers.records import RecordBatch
+from src.parsers.suppliers import assign_supplier_ids, cluster_suppliers, normalize_supplier
+
+SYL = ["shri", "ram", "krishna", "ganesh", "balaji", "laxmi", "sai", "om", "mahadev", "durga", "hari", "vishnu",
+       "amar", "jai", "bharat", "arihant", "shiv", "mahavir", "kamdhenu", "annapurna", "royal", "star", "sun",
+       "global", "national", "metro", "supreme", "prime", "united", "pioneer", "vardhman", "tirupati", "gupta",
+       "sharma", "patel", "agarwal", "mehta", "jain", "singh", "reddy", "kumar", "rathi", "bansal", "goyal",
+       "kothari", "modi", "vijay", "anand", "ashok", "deepak", "rajesh", "suresh", "mukesh", "neelkanth",
+       "siddhi", "vinayak", "radhe", "gopal", "keshav", "madhav", "hanuman", "bajrang", "ambika", "kaveri"]
+TRADE = ["steel", "traders", "enterprises", "industries", "textiles", "polymers", "engineering works",
+         "electricals", "agro", "pipes", "machinery", "exports", "impex", "fabricators", "chemicals", "plast"]
+LEGAL = ["Pvt Ltd", "Pvt. Ltd.", "Private Limited", "Limited", "Ltd", "", "", "& Co"]
+SPELLING = {"shri": ["shree", "sri", "shri"], "laxmi": ["lakshmi", "laxmi"], "krishna": ["krisna", "krishna"],
+            "ganesh": ["ganesha", "ganesh"], "mahavir": ["mahaveer", "mahavir"], "hari": ["hary", "hari"]}
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    if len(word) < 5:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]  # swap
+    return word[:i] + word[i + 1:]  # drop
+
+
+def variant(base: list, rng: random.Random) -> str:
+    words = [rng.choice(SPELLING.get(w, [w])) for w in base]
+    r = rng.random()
+    if r < 0.15 and len(words) > 2:
+        words = [words[0] + words[1]] + words[2:]  # "shri ram" -> "shriram"
+    elif r < 0.35:
+        j = rng.randrange(len(words))
+        words[j] = _typo(words[j], rng)
+    name = " ".join(words) + " " + rng.choice(LEGAL)
+    if rng.random() < 0.1:
+        name = "M/s " + name
+    return rng.choice([str.title, str.upper, str.lower])(name.strip())
+
+
+def synthetic(n_suppliers: int, seed: int = 3):
+    """(raw names, true supplier per name): 1-8 spellings per supplier."""
+    rng = random.Random(seed)
+    bases = set()
+    while len(bases) < n_suppliers:
+        bases.add(tuple(rng.sample(SYL, rng.randint(1, 3))) + (rng.choice(TRADE),))
+    names, truth = [], []
+    for k, base in enumerate(sorted(bases)):
+        for _ in range(rng.randint(1, 8)):
+            names.append(variant(list(base), rng))
+            truth.append(k)
+    return names, truth
+
+
+def pairwise_quality(truth, predicted):
+    def pairs(counts):
+        return sum(c * (c - 1) // 2 for c in counts.values())
+    tp = pairs(Counter(zip(truth, predicted)))
+    pred, true = pairs(Counter(predicted)), pairs(Counter(truth))
+    precision = tp / pred if pred else 1.0
+    recall = tp / true if true else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jsonl", type=str, default="data/processed/products.jsonl")
+    parser.add_argument("--suppliers", type=int, default=20_000, help="Synthetic suppliers for the quality run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    jsonl = Path(args.jsonl)
+    if jsonl.exists():
+        batch = RecordBatch.from_jsonl(jsonl)
+        t0 = time.perf_counter()
+        stats = assign_supplier_ids(batch, workers=args.workers)
+        elapsed = time.perf_counter() - t0
+        print(f"[BENCH] {jsonl}: {len(batch)} products, {stats['names']} distinct supplier names -> "
+              f"{stats['clusters']} suppliers in {elapsed * 1000:.1f}ms")
+    else:
+        print(f"[BENCH] {jsonl} not found, skipping")
+
+    names, truth = synthetic(args.suppliers)
+    # unique raw spellings only: duplicates would inflate both precision and recall
+    first = {}
+    for name, t in zip(names, truth):
+        first.setdefault(name, t)
+    names, truth = list(first), list(first.values())
+    n = len(names)
+    # distinct spellings of different suppliers can normalize to the same string; that's a ceiling on precision
+    print(f"[BENCH] synthetic: {args.suppliers} suppliers, {n} distinct spellings "
+          f"({len({normalize_supplier(x) for x in names})} after normalization)")
+
+    for workers in sorted({1, args.workers}):
+        t0 = time.perf_counter()
+        ids, stats = cluster_suppliers(names, workers=workers)
+        elapsed = time.perf_counter() - t0
+        precision, recall, f1 = pairwise_quality(truth, [ids.get(x) for x in names])
+        print(f"[BENCH] workers={workers:2d}  {elapsed:6.2f}s  {n / elapsed:9,.0f} names/s  "
+              f"comparisons={stats['comparisons']:,} (all pairs: {n * (n - 1) // 2:,})  "
+              f"clusters={stats['clusters']}  precision={precision:.3f} recall={recall:.3f} f1={f1:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,15 @@ def main():
     plt.savefig(FIG_DIR / "price_min_hist.png")
 
     # top suppliers
-    s = df["supplier_name"].fillna("Unknown").value_counts().head(15)
+    if "supplier_id" in df.columns and df["supplier_id"].notna().any():
+        # count resolved suppliers, labelled with their most common spelling
+        # (clusters whose names are all missing keep the id as label)
+        named = df.dropna(subset=["supplier_name"])
+        labels = named.groupby("supplier_id")["supplier_name"].agg(lambda x: x.mode().iat[0])
+        s = df["supplier_id"].fillna("Unknown").value_counts().head(15)
+        s = s.rename(index=lambda k: labels.get(k, k))
+    else:
+        s = df["supplier_name"].fillna("Unknown").value_counts().head(15)
     plt.figure(figsize=(8,5))
     s.plot(kind="bar")
     plt.title("Top suppliers")
@@ -81,7 +81,8 @@ class IndiaMartCollector(BaseCollector):
 # src/collectors/indiamart.py
 import asyncio
 import re
-from typing import List, Dict, Any
+import sys
+from typing import List
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -89,6 +90,8 @@ from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 from bs4 import BeautifulSoup
 
 from src.collectors.base import BaseCollector
+from src.parsers.models import parse_price
+from src.parsers.records import ProductRecord
 from src.utils.throttle import polite_sleep
 
 
@@ -115,8 +118,9 @@ class IndiaMartCollector(BaseCollector):
         m = re.search(r'((?:₹|Rs\.?|INR|\$)\s?[\d,]+(?:\.\d+)?(?:\s*-\s*[\d,]+(?:\.\d+)?)?)', text, re.I)
         return m.group(1).strip() if m else None
 
-    def collect(self, category: str, category_url: str, limit=100, save_raw=False) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
+    def collect(self, category: str, category_url: str, limit=100, save_raw=False) -> List[ProductRecord]:
+        out: List[ProductRecord] = []
+        category = sys.intern(category)
         page = 1
         seen = set()
 
@@ -182,7 +186,8 @@ class IndiaMartCollector(BaseCollector):
                     if parent and parent.parent:
                         parent = parent.parent
                 snippet_text = parent.get_text(" ", strip=True) if parent else a.get_text(" ", strip=True)
-                snippet_html = str(parent)[:1200] if parent else ""
+                # raw markup is only kept alongside raw HTML: at ~1.2 KB it dominates per-item memory
+                snippet_html = (str(parent)[:1200] if parent else "") if save_raw else None
 
                 if not title or not href:
                     continue
@@ -192,7 +197,7 @@ class IndiaMartCollector(BaseCollector):
                     continue
                 seen.add(key)
 
-                price = self._extract_price(snippet_text)
+                price_min, price_max, currency = parse_price(self._extract_price(snippet_text))
 
                 # find supplier name heuristics inside parent
                 supplier_node = None
@@ -200,15 +205,17 @@ class IndiaMartCollector(BaseCollector):
                     supplier_node = parent.select_one("[class*='supplier'], [class*='comp'], [class*='company'], .supName, .cmpny")
                 supplier = supplier_node.get_text(" ", strip=True) if supplier_node else None
 
-                item = {
-                    "marketplace": "indiamart",
-                    "category": category,
-                    "title": title,
-                    "price": price,
-                    "supplier_name": supplier,
-                    "url": href,
-                    "source_html_snippet": snippet_html
-                }
+                item = ProductRecord(
+                    marketplace="indiamart",
+                    category=category,
+                    title=title,
+                    price_min=price_min,
+                    price_max=price_max,
+                    currency=currency,
+                    supplier_name=supplier,
+                    url=href,
+                    source_html_snippet=snippet_html,
+                )
                 out.append(item)
 
             page += 1
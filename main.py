@@ -2,18 +2,27 @@
 import argparse
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any
 
-from src.collectors.indiamart import IndiaMartCollector
-from src.collectors.alibaba import AlibabaCollector
-from src.parsers.models import Product, to_jsonl, to_csv
-from src.utils.storage import ensure_dirs, dedupe_products
+from src.parsers.records import RecordBatch
+from src.parsers.suppliers import assign_supplier_ids
+from src.utils.storage import ensure_dirs, dedupe_batch
+from src.utils.search_index import ProductIndex
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
+def index_path_from(cfg: Dict[str, Any]) -> Path:
+    out_dir = Path(cfg.get("output_dir", "data/processed"))
+    basename = cfg.get("output_basename", "products")
+    return Path(cfg.get("search_index", out_dir / f"{basename}.db"))
+
 def run(categories_file: Path, config_file: Path):
+    # imported here so `search` / `index` work without the crawler dependencies
+    from src.collectors.indiamart import IndiaMartCollector
+    from src.collectors.alibaba import AlibabaCollector
+
     cfg = load_yaml(config_file)
     cats = load_yaml(categories_file)
 
@@ -29,7 +38,7 @@ def run(categories_file: Path, config_file: Path):
     save_raw = bool(cfg.get("save_raw_html", False))
     basename = cfg.get("output_basename", "products")
 
-    all_products: List[Product] = []
+    all_products = RecordBatch()
 
     # IndiaMart
     im_cats = cats.get("indiamart", {})
@@ -39,8 +48,7 @@ def run(categories_file: Path, config_file: Path):
         raw = im.collect(category=cat_name, category_url=url, limit=limit, save_raw=save_raw)
         for r in raw:
             try:
-                p = Product(**r)
-                all_products.append(p)
+                all_products.add(r)
             except Exception as e:
                 print(f"[VALIDATION] IndiaMart item skipped: {e}")
 
@@ -52,26 +60,86 @@ def run(categories_file: Path, config_file: Path):
         raw = ab.collect(category=cat_name, category_url=url, limit=limit, save_raw=save_raw)
         for r in raw:
             try:
-                p = Product(**r)
-                all_products.append(p)
+                all_products.add(r)
             except Exception as e:
                 print(f"[VALIDATION] Alibaba item skipped: {e}")
 
     # Dedupe
-    all_products = dedupe_products(all_products)
+    all_products = dedupe_batch(all_products)
+
+    # Supplier entity resolution
+    # supplier_ids.json keeps each supplier's id stable across crawls
+    id_map = Path(cfg.get("supplier_ids", out_dir / "supplier_ids.json"))
+    stats = assign_supplier_ids(all_products, id_map=id_map)
+    print(f"[SUPPLIERS] {stats['names']} distinct names -> {stats['clusters']} suppliers.")
 
     # Save
     out_jsonl = out_dir / f"{basename}.jsonl"
     out_csv = out_dir / f"{basename}.csv"
-    to_jsonl(all_products, out_jsonl)
-    to_csv(all_products, out_csv)
+    all_products.to_jsonl(out_jsonl)
+    all_products.to_csv(out_csv)
 
     print(f"[DONE] Saved {len(all_products)} products to {out_jsonl} and {out_csv}.")
 
+    # Search index: upsert this crawl's products, earlier crawls stay searchable
+    index_path = index_path_from(cfg)
+    with ProductIndex(index_path) as idx:
+        idx.update(all_products)
+        print(f"[INDEX] {len(all_products)} products upserted, {len(idx)} total in {index_path}.")
+
+
+def build_index(config_file: Path, jsonl_path: Path = None):
+    cfg = load_yaml(config_file)
+    if jsonl_path is None:
+        out_dir = Path(cfg.get("output_dir", "data/processed"))
+        jsonl_path = out_dir / f"{cfg.get('output_basename', 'products')}.jsonl"
+    batch = dedupe_batch(RecordBatch.from_jsonl(jsonl_path))
+    index_path = index_path_from(cfg)
+    with ProductIndex(index_path) as idx:
+        idx.rebuild(batch)
+        idx.optimize()
+        print(f"[INDEX] Rebuilt {index_path} from {jsonl_path}: {len(idx)} products.")
+
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def search(config_file: Path, query: str, marketplace: str = None, min_price: float = None,
+           max_price: float = None, limit: int = 20):
+    index_path = index_path_from(load_yaml(config_file))
+    if not index_path.exists():
+        print(f"[ERR] No search index at {index_path}. Run the collector or `index` first.")
+        return
+    with ProductIndex(index_path) as idx:
+        hits = idx.search(query, marketplace=marketplace, min_price=min_price, max_price=max_price, limit=limit)
+    for h in hits:
+        price = "-" if h["price_min"] is None else f"{h['price_min']:g} {h['currency'] or ''}".strip()
+        print(f"[{h['marketplace']}] {h['title']} | {h['supplier_name'] or '-'} | {h['category']} | {price} | {h['url']}")
+    print(f"[SEARCH] {len(hits)} results")
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--categories", type=str, default="categories.yaml", help="Path to categories.yaml")
     parser.add_argument("--config", type=str, default="config.yaml", help="Path to config.yaml")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("crawl", help="Crawl all categories and save (default)")
+    p_index = sub.add_parser("index", help="Rebuild the search index from a products.jsonl")
+    p_index.add_argument("--jsonl", type=str, default=None, help="Path to products.jsonl (default: output dir)")
+    p_search = sub.add_parser("search", help="Search the product index")
+    p_search.add_argument("query", type=str, help="Words to match in title/supplier/category; `word*` for prefix")
+    p_search.add_argument("--marketplace", type=str, default=None)
+    p_search.add_argument("--min-price", type=float, default=None)
+    p_search.add_argument("--max-price", type=float, default=None)
+    p_search.add_argument("--limit", type=positive_int, default=20)
     args = parser.parse_args()
-    run(Path(args.categories), Path(args.config))
+    if args.command == "search":
+        search(Path(args.config), args.query, args.marketplace, args.min_price, args.max_price, args.limit)
+    elif args.command == "index":
+        build_index(Path(args.config), Path(args.jsonl) if args.jsonl else None)
+    else:
+        run(Path(args.categories), Path(args.config))
@@ -1,8 +1,30 @@
 #src\parsers\models.py
-from typing import Optional, List
+import re
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field, HttpUrl, field_validator
-from pathlib import Path
-import pandas as pd
+
+def norm_currency(v):
+    if not v:
+        return v
+    v = v.upper().strip().replace("RS.", "INR").replace("RS", "INR")
+    if v in {"₹", "INR", "USD"}:
+        return v
+    return v
+
+def norm_title(v):
+    return " ".join(v.split()) if v else v
+
+_PRICE_RE = re.compile(r'(₹|Rs\.?|INR|US\$|\$)\s?(\d[\d,]*(?:\.\d+)?)(?:\s*-\s*(\d[\d,]*(?:\.\d+)?))?', re.I)
+
+def parse_price(text) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    """"₹ 1,200 - 1,500" -> (1200.0, 1500.0, "INR"); (None, None, None) if no price found."""
+    m = _PRICE_RE.search(text) if text else None
+    if not m:
+        return None, None, None
+    currency = "USD" if "$" in m.group(1) else "INR"
+    price_min = float(m.group(2).replace(",", ""))
+    price_max = float(m.group(3).replace(",", "")) if m.group(3) else None
+    return price_min, price_max, currency
 
 class Product(BaseModel):
     marketplace: str
@@ -13,6 +35,7 @@ class Product(BaseModel):
     currency: Optional[str] = None
     unit: Optional[str] = None
     supplier_name: Optional[str] = None
+    supplier_id: Optional[str] = None
     supplier_location: Optional[str] = None
     url: Optional[str] = None
     source_html_snippet: Optional[str] = None
@@ -20,25 +43,9 @@ class Product(BaseModel):
     @field_validator("currency")
     @classmethod
     def normalize_currency(cls, v):
-        if not v:
-            return v
-        v = v.upper().strip().replace("RS.", "INR").replace("RS", "INR")
-        if v in {"₹", "INR", "USD"}:
-            return v
-        return v
+        return norm_currency(v)
 
     @field_validator("title")
     @classmethod
     def clean_title(cls, v):
-        return " ".join(v.split()) if v else v
-
-def to_jsonl(items: List[Product], path: Path):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for it in items:
-            f.write(it.model_dump_json() + "\n")
-
-def to_csv(items: List[Product], path: Path):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    df = pd.DataFrame([it.model_dump() for it in items])
-    df.to_csv(path, index=False)
+        return norm_title(v)
@@ -0,0 +1,158 @@
+#src\parsers\records.py
+import json
+import math
+import sys
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Optional, List, Iterable, Iterator
+
+import pandas as pd
+
+from src.parsers.models import Product, norm_currency, norm_title
+
+FIELDS = tuple(Product.model_fields)
+# low-cardinality columns, stored as categorical (pandas) / dictionary (arrow)
+CATEGORICAL = ("marketplace", "category")
+
+
+@dataclass(slots=True)
+class ProductRecord:
+    """Raw item emitted by a collector, same fields as Product but no validation."""
+    marketplace: str
+    category: str
+    title: str
+    price_min: Optional[float] = None
+    price_max: Optional[float] = None
+    currency: Optional[str] = None
+    unit: Optional[str] = None
+    supplier_name: Optional[str] = None
+    supplier_id: Optional[str] = None
+    supplier_location: Optional[str] = None
+    url: Optional[str] = None
+    source_html_snippet: Optional[str] = None
+
+
+# __iter__ rebuilds records positionally from the columns
+assert FIELDS == tuple(f.name for f in fields(ProductRecord)), "ProductRecord fields must match Product"
+
+
+def _require_str(name, v):
+    if not isinstance(v, str):
+        raise ValueError(f"{name}: input should be a valid string, got {v!r}")
+    return v
+
+
+def _optional_str(name, v):
+    return None if v is None else _require_str(name, v)
+
+
+def _intern(v):
+    return sys.intern(v) if v else v
+
+
+def _to_float(name, v):
+    if v is None:
+        return None
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}: input should be a valid number, got {v!r}")
+    # NaN/inf have no JSON form; model_dump_json writes them as null too
+    return v if math.isfinite(v) else None
+
+
+class RecordBatch:
+    """Columnar store of validated products (one list per field).
+
+    Holds products between validation and saving without a model instance
+    or dict per item.
+    """
+    __slots__ = ("_cols",)
+
+    def __init__(self):
+        self._cols = {name: [] for name in FIELDS}
+
+    def __len__(self):
+        return len(self._cols["title"])
+
+    def __iter__(self) -> Iterator[ProductRecord]:
+        for row in zip(*self._cols.values()):
+            yield ProductRecord(*row)
+
+    def column(self, name: str) -> List:
+        return self._cols[name]
+
+    def add(self, rec: ProductRecord):
+        """Validate/normalize like Product(**r) and append one row; raises ValueError."""
+        row = {
+            "marketplace": sys.intern(_require_str("marketplace", rec.marketplace)),
+            "category": sys.intern(_require_str("category", rec.category)),
+            "title": norm_title(_require_str("title", rec.title)),
+            "price_min": _to_float("price_min", rec.price_min),
+            "price_max": _to_float("price_max", rec.price_max),
+            "currency": _intern(norm_currency(_optional_str("currency", rec.currency))),
+            "unit": _intern(_optional_str("unit", rec.unit)),
+            "supplier_name": _optional_str("supplier_name", rec.supplier_name),
+            "supplier_id": _optional_str("supplier_id", rec.supplier_id),
+            "supplier_location": _intern(_optional_str("supplier_location", rec.supplier_location)),
+            "url": _optional_str("url", rec.url),
+            "source_html_snippet": _optional_str("source_html_snippet", rec.source_html_snippet),
+        }
+        for name, col in self._cols.items():
+            col.append(row[name])
+
+    def set_column(self, name: str, values: List):
+        if len(values) != len(self):
+            raise ValueError(f"{name}: expected {len(self)} values, got {len(values)}")
+        self._cols[name] = list(values)
+
+    def extend(self, other: "RecordBatch"):
+        for name, col in other._cols.items():
+            self._cols[name].extend(col)
+
+    def take(self, indices: Iterable[int]) -> "RecordBatch":
+        indices = list(indices)
+        out = RecordBatch()
+        for name, col in self._cols.items():
+            out._cols[name] = [col[i] for i in indices]
+        return out
+
+    @classmethod
+    def from_jsonl(cls, path: Path) -> "RecordBatch":
+        """Load a products.jsonl written by to_jsonl; unknown keys (older exports) are ignored."""
+        batch = cls()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    batch.add(ProductRecord(**{k: v for k, v in row.items() if k in FIELDS}))
+        return batch
+
+    def to_pandas(self) -> pd.DataFrame:
+        data = {}
+        for name, col in self._cols.items():
+            data[name] = pd.Categorical(col) if name in CATEGORICAL else col
+        return pd.DataFrame(data, columns=list(FIELDS))
+
+    def to_arrow(self):
+        import pyarrow as pa  # optional, only needed for Arrow export
+
+        arrays = {}
+        for name, col in self._cols.items():
+            if name in ("price_min", "price_max"):
+                arrays[name] = pa.array(col, type=pa.float64())
+            elif name in CATEGORICAL:
+                arrays[name] = pa.array(col, type=pa.string()).dictionary_encode()
+            else:
+                arrays[name] = pa.array(col, type=pa.string())
+        return pa.table(arrays)
+
+    def to_jsonl(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for row in zip(*self._cols.values()):
+                f.write(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def to_csv(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.to_pandas().to_csv(path, index=False)
@@ -0,0 +1,174 @@
+#src\utils\search_index.py
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+
+from src.parsers.records import RecordBatch
+
+# stored (not indexed) columns returned with each hit
+RESULT_FIELDS = ("marketplace", "category", "title", "price_min", "price_max", "currency",
+                 "unit", "supplier_name", "supplier_location", "url")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    marketplace TEXT NOT NULL,
+    category TEXT NOT NULL,
+    title TEXT NOT NULL,
+    price_min REAL,
+    price_max REAL,
+    currency TEXT,
+    unit TEXT,
+    supplier_name TEXT,
+    supplier_location TEXT,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS products_marketplace ON products(marketplace, price_min);
+CREATE INDEX IF NOT EXISTS products_price ON products(price_min);
+
+-- external-content FTS table: only the inverted index is stored, text lives in products
+CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+    title, supplier_name, category,
+    content='products', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS products_ai AFTER INSERT ON products BEGIN
+    INSERT INTO products_fts(rowid, title, supplier_name, category)
+    VALUES (new.id, new.title, new.supplier_name, new.category);
+END;
+CREATE TRIGGER IF NOT EXISTS products_ad AFTER DELETE ON products BEGIN
+    INSERT INTO products_fts(products_fts, rowid, title, supplier_name, category)
+    VALUES ('delete', old.id, old.title, old.supplier_name, old.category);
+END;
+CREATE TRIGGER IF NOT EXISTS products_au AFTER UPDATE ON products BEGIN
+    INSERT INTO products_fts(products_fts, rowid, title, supplier_name, category)
+    VALUES ('delete', old.id, old.title, old.supplier_name, old.category);
+    INSERT INTO products_fts(rowid, title, supplier_name, category)
+    VALUES (new.id, new.title, new.supplier_name, new.category);
+END;
+"""
+
+_UPSERT = f"""
+INSERT INTO products (key, {", ".join(RESULT_FIELDS)})
+VALUES (?, {", ".join("?" for _ in RESULT_FIELDS)})
+ON CONFLICT(key) DO UPDATE SET {", ".join(f"{c}=excluded.{c}" for c in RESULT_FIELDS)}
+"""
+
+# bm25 column weights for title, supplier_name, category
+BM25_WEIGHTS = (3.0, 2.0, 1.0)
+
+_TOKEN_RE = re.compile(r"(\w+)(\*?)")
+
+
+def product_key(url, title) -> str:
+    # same identity as dedupe_batch
+    return f"{url or ''}\t{(title or '').lower()}"
+
+
+def parse_query(query: str) -> List[Tuple[str, bool]]:
+    """Lowercased (word, is_prefix) terms; `foo*` is a prefix term."""
+    return [(word, bool(star)) for word, star in _TOKEN_RE.findall(query.lower())]
+
+
+def to_match_query(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression; terms are ANDed."""
+    return " ".join(f'"{word}"' + ("*" if prefix else "") for word, prefix in parse_query(query))
+
+
+class ProductIndex:
+    """Persistent inverted index over title, supplier_name and category (SQLite FTS5)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def update(self, batch: RecordBatch) -> int:
+        """Insert new products and refresh existing ones (matched by url + title). Returns rows written."""
+        with self.conn:
+            self.conn.executemany(_UPSERT, self._rows(batch))
+        return len(batch)
+
+    def rebuild(self, batch: RecordBatch) -> int:
+        """Replace the whole index with `batch` (products not in it are dropped). Returns rows written."""
+        with self.conn:
+            self.conn.execute("DELETE FROM products")  # triggers clear products_fts
+            self.conn.executemany(_UPSERT, self._rows(batch))
+        return len(batch)
+
+    @staticmethod
+    def _rows(batch: RecordBatch):
+        cols = [batch.column(name) for name in RESULT_FIELDS]
+        url_col, title_col = batch.column("url"), batch.column("title")
+        return (
+            (product_key(url, title), *values)
+            for url, title, values in zip(url_col, title_col, zip(*cols))
+        )
+
+    def optimize(self):
+        """Merge FTS segments; worth running after large bulk loads."""
+        with self.conn:
+            self.conn.execute("INSERT INTO products_fts(products_fts) VALUES ('optimize')")
+
+    def search(self, query: str, marketplace: Optional[str] = None, min_price: Optional[float] = None,
+               max_price: Optional[float] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Matches for `query` ranked by bm25 (title > supplier > category); price filters keep
+        products whose range lies in [min_price, max_price].
+
+        An empty query returns the newest products passing the filters; a query with no
+        searchable words ("***") returns nothing.
+        """
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        terms = parse_query(query)
+        if query.strip() and not terms:
+            return []
+        cols = ", ".join("p." + c for c in RESULT_FIELDS)
+        where, params = [], []
+        if marketplace:
+            where.append("p.marketplace = ?")
+            params.append(marketplace.lower())
+        if min_price is not None:
+            where.append("p.price_min >= ?")
+            params.append(float(min_price))
+        if max_price is not None:
+            where.append("COALESCE(p.price_max, p.price_min) <= ?")
+            params.append(float(max_price))
+        cond = (" WHERE " + " AND ".join(where)) if where else ""
+
+        if not terms:
+            # filters only, newest first
+            sql = f"SELECT {cols} FROM products p{cond} ORDER BY p.id DESC LIMIT ?"
+            return [dict(zip(RESULT_FIELDS, row)) for row in self.conn.execute(sql, params + [limit])]
+
+        match = to_match_query(query)
+        bm25 = f"bm25(products_fts, {', '.join(str(w) for w in BM25_WEIGHTS)})"
+        if where:
+            # filters are checked before scoring, so only matches that pass them are ranked
+            sql = (f"SELECT {cols} FROM products_fts JOIN products p ON p.id = products_fts.rowid "
+                   f"WHERE products_fts MATCH ? AND {' AND '.join(where)} ORDER BY {bm25}, p.id DESC LIMIT ?")
+        else:
+            # rank inside FTS5, then load only the top rows: a products lookup per match
+            # costs more than scoring it
+            sql = (f"SELECT {cols} FROM (SELECT rowid, {bm25} AS score FROM products_fts "
+                   f"WHERE products_fts MATCH ? ORDER BY score, rowid DESC LIMIT ?) h "
+                   f"CROSS JOIN products p ON p.id = h.rowid ORDER BY h.score, p.id DESC")
+        return [dict(zip(RESULT_FIELDS, row)) for row in self.conn.execute(sql, [match] + params + [limit])]
@@ -1,19 +1,20 @@
 #src\utils\storage.py
 from pathlib import Path
-from typing import Iterable, List
-from src.parsers.models import Product
+from typing import Iterable
+from src.parsers.records import RecordBatch
 
 def ensure_dirs(paths: Iterable[str]):
     for p in paths:
         Path(p).mkdir(parents=True, exist_ok=True)
 
-def dedupe_products(items: List[Product]) -> List[Product]:
+def dedupe_batch(batch: RecordBatch) -> RecordBatch:
     seen = set()
-    out = []
-    for it in items:
-        key = (str(it.url or ""), (it.title or "").lower())
+    keep = []
+    urls, titles = batch.column("url"), batch.column("title")
+    for i, (url, title) in enumerate(zip(urls, titles)):
+        key = (str(url or ""), (title or "").lower())
         if key in seen:
             continue
         seen.add(key)
-        out.append(it)
-    return out
+        keep.append(i)
+    return batch.take(keep)
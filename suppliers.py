@@ -0,0 +1,293 @@
+#src\parsers\suppliers.py
+import hashlib
+import json
+import os
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Iterable
+
+from src.parsers.records import RecordBatch
+
+# legal forms / filler dropped before matching ("M/s Shree Ram Pvt. Ltd." -> "shri ram")
+STOPWORDS = {"m", "s", "ms", "the", "and", "pvt", "private", "ltd", "limited", "llp", "inc", "co", "company",
+             "corp", "corporation", "opc"}
+# honorifics written many ways, too short for fuzzy matching
+ALIASES = {"shree": "shri", "sri": "shri", "shre": "shri", "sree": "shri"}
+# whole-name placeholders for a missing supplier ("N/A", "-", "Unknown"), compared without separators
+PLACEHOLDERS = {"", "na", "nil", "none", "null", "unknown", "notavailable"}
+SIMILARITY = 0.8            # SequenceMatcher ratio between two tokens
+PHONETIC_SIMILARITY = 0.65  # same, when both tokens have the same soundex code
+JOINED_SIMILARITY = 0.9     # same, for two words written as one
+MAX_TYPO_CHARS = 2          # unmatched characters allowed between non-phonetic tokens
+MAX_BLOCK = 100             # larger blocks fall back to a sorted-neighbourhood window
+WINDOW = 20
+PARALLEL_MIN_NAMES = 5000   # below this a process pool costs more than it saves
+
+_SOUNDEX = str.maketrans("bfpvcgjkqsxzdtlmnr", "111122222222334556")
+
+
+def _tokens(name: str) -> List[str]:
+    # NFKD, then accents dropped from Latin letters only: in Indic scripts the vowel signs and
+    # virama are marks too, and are kept with their letters ("श्री" stays one token)
+    chars = []
+    for ch in unicodedata.normalize("NFKD", name):
+        if unicodedata.combining(ch) and chars and chars[-1].isascii():
+            continue
+        chars.append(ch if ch.isalnum() or unicodedata.category(ch)[0] == "M" else " ")
+    return "".join(chars).lower().split()
+
+
+def normalize_supplier(name: Optional[str]) -> str:
+    """Lowercase, strip accents/punctuation and legal forms; "" if nothing is left.
+
+    Non-Latin names keep their own tokens ("深圳市华强电子有限公司" is not "").
+    """
+    if not name:
+        return ""
+    tokens = _tokens(name)
+    if "".join(tokens) in PLACEHOLDERS:
+        return ""
+    return " ".join(ALIASES.get(t, t) for t in tokens if t not in STOPWORDS)
+
+
+@lru_cache(maxsize=1 << 16)
+def soundex(token: str) -> str:
+    if not (token.isascii() and token.isalpha()):
+        return token
+    codes = token.translate(_SOUNDEX)
+    out, last = token[0].upper(), codes[0]
+    for ch, code in zip(token[1:], codes[1:]):
+        if code.isdigit() and code != last:
+            out += code
+        if ch not in "hw":
+            last = code
+    # not truncated to 4: long joined tokens ("ambikareddy") must not collide with their first word
+    return out.ljust(4, "0")
+
+
+def _phonetic(tokens: List[str]) -> List[str]:
+    # trailing plural "s" ignored ("steels" / "steel")
+    return [soundex(t[:-1] if len(t) > 3 and t.endswith("s") else t) for t in tokens]
+
+
+def blocking_keys(norm: str) -> List[str]:
+    """Keys a name is filed under; only names sharing a key are ever compared."""
+    tokens = norm.split()
+    codes = _phonetic(tokens)
+    keys = [
+        "p:" + " ".join(sorted(codes)),          # spelling variants, reordering
+        "h:" + norm.replace(" ", "")[:6],        # split/joined words ("shriram" / "shri ram")
+    ]
+    if len(tokens) > 1:
+        # one token dropped: a typo that changes its phonetic code still shares these
+        for i in range(len(tokens)):
+            keys.append(f"d{len(tokens)}:" + " ".join(sorted(codes[:i] + codes[i + 1:])))
+    return list(dict.fromkeys(keys))  # dropping either of two same-code tokens gives one key
+
+
+@lru_cache(maxsize=1 << 18)
+def _tokens_match(a: str, b: str, threshold: Optional[float] = None) -> bool:
+    if a == b:
+        return True
+    phonetic = threshold is None and soundex(a) == soundex(b)
+    if threshold is None:
+        threshold = PHONETIC_SIMILARITY if phonetic else SIMILARITY
+    if a[0] != b[0]:  # typos rarely hit the first letter; "goyal" is not "royal"
+        return False
+    total = len(a) + len(b)
+    if 2 * min(len(a), len(b)) / total < threshold:  # ratio upper bound
+        return False
+    ratio = SequenceMatcher(None, a, b, autojunk=False).ratio()
+    # otherwise a single typo at most: "madhavsai" is not "madhav"
+    return ratio >= threshold and (phonetic or total * (1 - ratio) <= MAX_TYPO_CHARS + 1e-9)
+
+
+def _aligned(ta: List[str], tb: List[str]) -> bool:
+    rest = list(tb)
+    for t in ta:
+        for j, u in enumerate(rest):
+            if _tokens_match(t, u):
+                del rest[j]
+                break
+        else:
+            return False
+    return True
+
+
+def similar(a: str, b: str) -> bool:
+    """Same words up to order, spacing, spelling variants and small typos.
+
+    Compared token by token: a whole-string ratio would let a long shared word
+    ("hari fabricators" / "jai fabricators") outweigh the distinctive one.
+    """
+    if a.replace(" ", "") == b.replace(" ", ""):
+        return True
+    ta, tb = a.split(), b.split()
+    if len(ta) < len(tb):
+        ta, tb = tb, ta
+    if len(ta) == len(tb):
+        return _aligned(ta, tb)
+    if len(ta) == len(tb) + 1:
+        # two words written as one ("ambikakrishna" / "ambika krisna"); held to a stricter
+        # ratio so a short extra word isn't absorbed ("agarwal ram" / "agarwal")
+        for i in range(len(ta) - 1):
+            joined = ta[i] + ta[i + 1]
+            for j, u in enumerate(tb):
+                if _tokens_match(joined, u, JOINED_SIMILARITY) and _aligned(ta[:i] + ta[i + 2:], tb[:j] + tb[j + 1:]):
+                    return True
+    return False
+
+
+def _compared_earlier(key: str, a: str, b: str, windowed: Dict[str, Dict[str, int]],
+                      keys_of: Dict[str, Tuple[str, ...]]) -> bool:
+    # does a block with a smaller key than `key` compare a with b? every small block does,
+    # a windowed one only if they are within WINDOW of each other
+    kb = keys_of[b]
+    for k in keys_of[a]:  # sorted
+        if k >= key:
+            return False
+        if k in kb:
+            pos = windowed.get(k)
+            if pos is None or abs(pos[a] - pos[b]) <= WINDOW:
+                return True
+    return False
+
+
+def _match_blocks(blocks: List[Tuple[str, List[str]]],
+                  windowed: Dict[str, Dict[str, int]]) -> Tuple[List[Tuple[str, str]], int]:
+    """Matching pairs within each block, plus the number of comparisons made.
+
+    A pair filed under several blocks is compared only in the first (by key) that would
+    compare it, so neither the work nor the count depends on how blocks are chunked.
+    `windowed` holds each oversized block's sorted positions.
+    """
+    pairs, compared, keys_of = [], 0, {}
+    for key, names in blocks:
+        window = WINDOW if key in windowed else len(names)
+        for n in names:
+            if n not in keys_of:
+                keys_of[n] = tuple(sorted(blocking_keys(n)))
+        for i, a in enumerate(names):
+            for b in names[i + 1:i + 1 + window]:
+                if _compared_earlier(key, a, b, windowed, keys_of):
+                    continue
+                compared += 1
+                if similar(a, b):
+                    pairs.append((a, b))
+    return pairs, compared
+
+
+def _chunks(blocks: List[Tuple[str, List[str]]], n: int) -> List[List[Tuple[str, List[str]]]]:
+    # spread blocks so every chunk gets a similar number of comparisons
+    chunks, load = [[] for _ in range(n)], [0] * n
+    for key, names in sorted(blocks, key=lambda b: (-len(b[1]), b[0])):
+        i = load.index(min(load))
+        chunks[i].append((key, names))
+        load[i] += len(names) * (len(names) if len(names) <= MAX_BLOCK else WINDOW)
+    return [c for c in chunks if c]
+
+
+def cluster_suppliers(names: Iterable[Optional[str]], workers: Optional[int] = None,
+                      known: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """Map each distinct raw supplier name to a supplier_id.
+
+    `known` (normalized name -> supplier_id from earlier runs) keeps ids stable: its names are
+    clustered along with the new ones, and a cluster containing a known name reuses that id
+    (the smallest one if a new spelling bridges two known clusters). Other clusters get a hash
+    of their smallest normalized name, so the result does not depend on input order. `known`
+    is updated in place with every name seen. Returns (raw name -> supplier_id, stats); names
+    that normalize to "" get no id.
+    """
+    known = {} if known is None else known
+    norm_of = {raw: normalize_supplier(raw) for raw in set(names) if raw}
+    current = {n for n in norm_of.values() if n}
+    norms = sorted(current | set(known))
+
+    blocks = defaultdict(list)
+    for n in norms:
+        for key in blocking_keys(n):
+            blocks[key].append(n)
+    blocks = [(key, b) for key, b in blocks.items() if len(b) > 1]
+    # larger blocks fall back to a sorted neighbourhood, ignoring spaces so "shriram" sits next to "shri ram"
+    windowed = {}
+    for i, (key, b) in enumerate(blocks):
+        if len(b) > MAX_BLOCK:
+            b = sorted(b, key=lambda n: n.replace(" ", ""))
+            blocks[i] = (key, b)
+            windowed[key] = {n: j for j, n in enumerate(b)}
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(norms) >= PARALLEL_MIN_NAMES:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_match_blocks, _chunks(blocks, workers * 4), repeat(windowed)))
+    else:
+        results = [_match_blocks(blocks, windowed)]
+
+    parent = {n: n for n in norms}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    compared = 0
+    for pairs, c in results:
+        compared += c
+        for a, b in pairs:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                # keep the smallest name as root
+                parent[max(ra, rb)] = min(ra, rb)
+
+    cluster_ids = {}
+    for n in norms:
+        if n in known:
+            root = find(n)
+            cluster_ids[root] = min(cluster_ids.get(root, known[n]), known[n])
+    for n in norms:
+        root = find(n)
+        if root not in cluster_ids:
+            cluster_ids[root] = "sup_" + hashlib.sha1(root.encode("utf-8")).hexdigest()[:12]
+        known[n] = cluster_ids[root]
+
+    stats = {"names": len(current), "blocks": len(blocks), "comparisons": compared,
+             "clusters": len({known[n] for n in current})}
+    return {raw: known[n] for raw, n in norm_of.items() if n}, stats
+
+
+def load_supplier_ids(path: Path) -> Dict[str, str]:
+    """Normalized name -> supplier_id map saved by a previous run ({} if there is none)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_supplier_ids(path: Path, known: Dict[str, str]):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(known.items())), f, ensure_ascii=False, indent=0)
+
+
+def assign_supplier_ids(batch: RecordBatch, workers: Optional[int] = None,
+                        id_map: Optional[Path] = None) -> Dict[str, int]:
+    """Cluster the batch's supplier names and fill its supplier_id column in place.
+
+    With `id_map`, ids from earlier runs are loaded from (and the updated map saved back to)
+    that JSON file, so a supplier keeps its id across crawls.
+    """
+    known = load_supplier_ids(id_map) if id_map else {}
+    raw = batch.column("supplier_name")
+    ids, stats = cluster_suppliers(raw, workers=workers, known=known)
+    batch.set_column("supplier_id", [ids.get(n) for n in raw])
+    if id_map:
+        save_supplier_ids(id_map, known)
+    return stats